@@ -6,19 +6,31 @@ A lightweight utility for generating numbered placeholder images for development
 """
 
 import argparse
+import atexit
+import io
+import json
 import os
 import sys
-from typing import Tuple, List, Optional, Literal
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple, List, Optional, Literal
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 
 
+@lru_cache(maxsize=None)
 def find_system_font() -> str:
     """
     Find an appropriate system font to use as default.
 
     Searches platform-specific font directories for common fonts, falling back
-    to general font directory traversal if needed.
+    to a traversal of the general font directories that stops at the first hit.
+    The result is cached for the lifetime of the process.
 
     Returns:
         Path to a usable font file.
@@ -63,15 +75,16 @@ def find_system_font() -> str:
     ]
 
     for font_dir in font_dirs:
-        if os.path.exists(font_dir):
-            for root, _, files in os.walk(font_dir):
-                for file in files:
-                    if file.lower().endswith(('.ttf', '.otf')):
-                        return os.path.join(root, file)
+        if os.path.isdir(font_dir):
+            # Lazy traversal: stops at the first font instead of listing the whole tree
+            for path in Path(font_dir).rglob("*"):
+                if path.suffix.lower() in ('.ttf', '.otf') and path.is_file():
+                    return str(path)
 
     raise FileNotFoundError("Could not find any usable font. Please specify a font with --font-path.")
 
 
+@lru_cache(maxsize=None)
 def parse_color(color: str) -> Tuple[int, ...]:
     """
     Parse color string (hex or name) to RGBA tuple.
@@ -80,6 +93,8 @@ def parse_color(color: str) -> Tuple[int, ...]:
     - 3/4/6/8 character hex formats (#rgb, #rgba, #rrggbb, #rrggbbaa)
     - All CSS3 color names (via PIL.ImageColor)
 
+    Results are cached, so each distinct color string is parsed once.
+
     Args:
         color: Color specification string
 
@@ -95,6 +110,139 @@ def parse_color(color: str) -> Tuple[int, ...]:
         raise ValueError(f"Unrecognized color: {color}")
 
 
+_PROGRESS_INTERVAL = 100
+_REFERENCE_FONT_SIZE = 100
+_MAX_SIZE_CORRECTIONS = 4
+_METRICS_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "dummy-img-gen", "fontmetrics.json"
+)
+# Bump when the font sizing algorithm changes so stale sizes are never served
+_METRICS_CACHE_VERSION = 1
+_METRICS_CACHE_MAX_ENTRIES = 1000
+
+# Font sizes recorded since the last _flush_metrics call
+_pending_metrics: Dict[str, int] = {}
+
+
+@lru_cache(maxsize=None)
+def _reference_font(font_path: str) -> ImageFont.FreeTypeFont:
+    """Load font_path once at the reference size used for size estimation."""
+    return ImageFont.truetype(font_path, _REFERENCE_FONT_SIZE)
+
+
+def _load_metrics_file() -> Dict[str, int]:
+    """Read the on-disk font size cache, empty if missing or unreadable."""
+    try:
+        with open(_METRICS_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+@lru_cache(maxsize=None)
+def _metrics_cache() -> Dict[str, int]:
+    """Load the on-disk font size cache once per process."""
+    return _load_metrics_file()
+
+
+def _is_font_size(value) -> bool:
+    """Check that a value read from the cache file is a usable font size."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _store_metric(key: str, font_size: int) -> None:
+    """Record a calculated font size; it reaches the disk on the next _flush_metrics."""
+    _metrics_cache()[key] = font_size
+    _pending_metrics[key] = font_size
+
+
+def _flush_metrics() -> None:
+    """
+    Write the font sizes recorded since the last flush to the on-disk cache.
+
+    The file is re-read and merged so entries written meanwhile by other
+    processes are kept, invalid entries are dropped and only the newest
+    _METRICS_CACHE_MAX_ENTRIES are retained. It is replaced atomically via a
+    temporary file, so concurrent workers never see a partial write. Failures
+    are ignored: the cache is only a shortcut.
+    """
+    if not _pending_metrics:
+        return
+
+    cache = {key: value for key, value in _load_metrics_file().items() if _is_font_size(value)}
+    for key, value in _pending_metrics.items():
+        cache.pop(key, None)  # Re-insert so the newest entries are kept on trimming
+        cache[key] = value
+    _pending_metrics.clear()
+    cache = dict(list(cache.items())[-_METRICS_CACHE_MAX_ENTRIES:])
+
+    cache_dir = os.path.dirname(_METRICS_CACHE_PATH)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, _METRICS_CACHE_PATH)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+atexit.register(_flush_metrics)
+
+
+def _fit_size(
+        text_bbox: Tuple[int, int, int, int],
+        font_size: int,
+        target_width: float,
+        target_height: float
+) -> int:
+    """Scale font_size so that text measuring text_bbox at that size fills the target box."""
+    scale = min(target_width / (text_bbox[2] - text_bbox[0]), target_height / (text_bbox[3] - text_bbox[1]))
+    return int(font_size * scale)
+
+
+def _center_xy(image_size: Tuple[int, int], text_bbox: Tuple[int, int, int, int]) -> Tuple[int, int]:
+    """Return the draw origin that centers text with the given bbox on the image."""
+    return (image_size[0] - (text_bbox[2] - text_bbox[0])) // 2, (image_size[1] - text_bbox[1] - text_bbox[3]) // 2
+
+
+def _text_fits(text: str, font_path: str, font_size: int, target_width: float, target_height: float) -> bool:
+    """Check whether text rendered at font_size stays within the target box."""
+    font = ImageFont.truetype(font_path, font_size)
+    text_bbox = font.getbbox(text)
+    return text_bbox[2] - text_bbox[0] <= target_width and text_bbox[3] - text_bbox[1] <= target_height
+
+
+def _search_font_size(
+        text: str,
+        font_path: str,
+        target_width: float,
+        target_height: float,
+        size_min: int,
+        size_max: int
+) -> int:
+    """Binary search for the largest font size that fits the target box."""
+    optimal_size = size_min
+
+    while size_min <= size_max:
+        mid_size = (size_min + size_max) // 2
+        try:
+            if _text_fits(text, font_path, mid_size, target_width, target_height):
+                optimal_size = mid_size
+                size_min = mid_size + 1
+            else:
+                size_max = mid_size - 1
+        except Exception:
+            size_max = mid_size - 1
+
+    return optimal_size
+
+
 def calculate_font_size(
         text: str,
         image_size: Tuple[int, int],
@@ -104,8 +252,12 @@ def calculate_font_size(
     """
     Calculate optimal font size to fit text in image with proper padding.
 
-    Uses binary search to find the largest font size that keeps text within
-    the specified ratio of the image dimensions.
+    Results are cached on disk in _METRICS_CACHE_PATH
+    ($XDG_CACHE_HOME/dummy-img-gen/fontmetrics.json, ~/.cache by default) keyed
+    by cache format and Pillow version, font file, modification time, text and
+    target box, so repeated runs skip the measurement entirely. Entries that
+    are not positive integers are measured again and overwritten. The file
+    keeps at most the newest _METRICS_CACHE_MAX_ENTRIES entries.
 
     Args:
         text: Text to measure
@@ -116,30 +268,183 @@ def calculate_font_size(
     Returns:
         Optimal font size in pixels
     """
+    try:
+        key = json.dumps([
+            _METRICS_CACHE_VERSION, PIL.__version__, os.path.abspath(font_path), os.path.getmtime(font_path),
+            text, image_size, target_ratio
+        ])
+    except OSError:
+        return _measure_font_size(text, image_size, font_path, target_ratio)
+
+    font_size = _metrics_cache().get(key)
+    if not _is_font_size(font_size):
+        font_size = _measure_font_size(text, image_size, font_path, target_ratio)
+        _store_metric(key, font_size)
+    return font_size
+
+
+def _measure_font_size(
+        text: str,
+        image_size: Tuple[int, int],
+        font_path: str,
+        target_ratio: float
+) -> int:
+    """
+    Measure the font size calculate_font_size returns, without the on-disk cache.
+
+    Text extents scale linearly with font size, so the size is estimated from
+    a measurement at a reference size, corrected once and then verified. Falls
+    back to a binary search when the estimate does not hold (e.g. bitmap fonts).
+    """
     width, height = image_size
     target_width = width * target_ratio
     target_height = height * target_ratio
-
     size_min, size_max = 10, min(width, height)
-    optimal_size = size_min
+    if size_max < size_min:
+        return size_min
 
-    while size_min <= size_max:
-        mid_size = (size_min + size_max) // 2
-        try:
-            font = ImageFont.truetype(font_path, mid_size)
-            text_bbox = font.getbbox(text)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
+    try:
+        ref_bbox = _reference_font(font_path).getbbox(text)
+        estimate = _fit_size(ref_bbox, _REFERENCE_FONT_SIZE, target_width, target_height)
+        estimate = max(size_min, min(size_max, estimate))
+        # Pixel rounding skews the small reference bbox, so correct once near the target size
+        estimate_bbox = ImageFont.truetype(font_path, estimate).getbbox(text)
+        estimate = max(size_min, min(size_max, _fit_size(estimate_bbox, estimate, target_width, target_height)))
 
-            if text_width <= target_width and text_height <= target_height:
-                optimal_size = mid_size
-                size_min = mid_size + 1
+        for _ in range(_MAX_SIZE_CORRECTIONS):
+            if not _text_fits(text, font_path, estimate, target_width, target_height):
+                if estimate == size_min:
+                    break
+                estimate -= 1
+            elif estimate == size_max or not _text_fits(text, font_path, estimate + 1, target_width, target_height):
+                return estimate
             else:
-                size_max = mid_size - 1
-        except Exception:
-            size_max = mid_size - 1
+                estimate += 1
+    except Exception:
+        pass
 
-    return optimal_size
+    return _search_font_size(text, font_path, target_width, target_height, size_min, size_max)
+
+
+@dataclass
+class _BatchContext:
+    """
+    Per-process state shared by every image of a batch.
+
+    Holds loaded fonts, auto-calculated font sizes, rasterized glyphs and blank
+    backgrounds so that a batch parses the TrueType file and renders each digit
+    once per size instead of once per image. Canvases of saved images are kept
+    in spare_canvases and repainted for later images, so a batch allocates only
+    as many image buffers as it has in flight.
+    """
+    font_path: str
+    font_cache: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = field(default_factory=dict)
+    size_cache: Dict[Tuple[str, Tuple[int, int], float], int] = field(default_factory=dict)
+    glyph_cache: Dict[Tuple[int, str], Tuple[Image.Image, Tuple[int, int, int, int], float]] = field(
+        default_factory=dict
+    )
+    background_cache: Dict[Tuple[str, Tuple[int, int], Tuple[int, ...]], Image.Image] = field(default_factory=dict)
+    spare_canvases: List[Image.Image] = field(default_factory=list)
+
+
+def _load_font(ctx: _BatchContext, font_size: int) -> ImageFont.FreeTypeFont:
+    """Return the context font at the given size, loading it on first use."""
+    key = (ctx.font_path, font_size)
+    font = ctx.font_cache.get(key)
+    if font is None:
+        font = ImageFont.truetype(ctx.font_path, font_size)
+        ctx.font_cache[key] = font
+    return font
+
+
+def _auto_font_size(ctx: _BatchContext, text: str, size: Tuple[int, int], padding: float) -> int:
+    """
+    Return the auto-calculated font size for text, shared by all same-width numbers.
+
+    The size is measured on the widest string of the same shape (every digit
+    replaced by 9), so it is computed once per digit count rather than per image.
+    """
+    sample = "".join("9" if c.isdigit() else c for c in text)
+    key = (sample, size, padding)
+    font_size = ctx.size_cache.get(key)
+    if font_size is None:
+        font_size = calculate_font_size(sample, size, ctx.font_path, 1.0 - 2 * padding)
+        ctx.size_cache[key] = font_size
+    return font_size
+
+
+def _load_glyph(
+        ctx: _BatchContext,
+        font_size: int,
+        char: str
+) -> Tuple[Image.Image, Tuple[int, int, int, int], float]:
+    """
+    Return (mask, bbox, advance) for a single character, rasterizing it on first use.
+
+    The mask is an "L" coverage tile cropped to the glyph's bounding box.
+    """
+    key = (font_size, char)
+    glyph = ctx.glyph_cache.get(key)
+    if glyph is None:
+        font = _load_font(ctx, font_size)
+        bbox = font.getbbox(char)
+        mask = Image.new("L", (bbox[2] - bbox[0], bbox[3] - bbox[1]), 0)
+        ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), char, font=font, fill=255)
+        glyph = (mask, bbox, font.getlength(char))
+        ctx.glyph_cache[key] = glyph
+    return glyph
+
+
+def _new_background(ctx: _BatchContext, mode: str, size: Tuple[int, int], color: Tuple[int, ...]) -> Image.Image:
+    """
+    Return a blank background, creating the template on first use.
+
+    A spare canvas of the same mode and size is repainted from the template
+    when one is available, which avoids allocating a new image buffer.
+    """
+    key = (mode, size, color)
+    template = ctx.background_cache.get(key)
+    if template is None:
+        template = Image.new(mode, size, color)
+        ctx.background_cache[key] = template
+
+    while ctx.spare_canvases:
+        canvas = ctx.spare_canvases.pop()
+        if canvas.mode == mode and canvas.size == size:
+            canvas.paste(template)
+            return canvas
+    return template.copy()
+
+
+def _draw_centered_text(
+        ctx: _BatchContext,
+        img: Image.Image,
+        text: str,
+        font_size: int,
+        fill: Tuple[int, ...]
+) -> None:
+    """
+    Draw text centered on img by pasting cached glyph tiles side by side.
+
+    Glyphs are placed at their advance positions without kerning, which is
+    exact for the tabular digits of common UI fonts.
+    """
+    glyphs = []
+    pen = 0.0
+    for char in text:
+        mask, bbox, advance = _load_glyph(ctx, font_size, char)
+        glyphs.append((mask, bbox, round(pen)))
+        pen += advance
+
+    left = glyphs[0][1][0]
+    right = max(offset + bbox[2] for _, bbox, offset in glyphs)
+    top = min(bbox[1] for _, bbox, _ in glyphs)
+    bottom = max(bbox[3] for _, bbox, _ in glyphs)
+
+    x, y = _center_xy(img.size, (left, top, right, bottom))
+    for mask, bbox, offset in glyphs:
+        if mask.width and mask.height:
+            img.paste(fill, (x + offset + bbox[0], y + bbox[1]), mask)
 
 
 def generate_placeholder_image(
@@ -153,7 +458,10 @@ def generate_placeholder_image(
         font_size: Optional[int] = None,
         jpg_quality: int = 90,
         overwrite: bool = False,
-        padding: float = 0.2
+        padding: float = 0.2,
+        png_compress_level: int = 1,
+        encoder: Literal["pillow", "vips"] = "pillow",
+        ctx: Optional[_BatchContext] = None
 ) -> str:
     """
     Generate a single placeholder image with a centered number.
@@ -170,62 +478,359 @@ def generate_placeholder_image(
         jpg_quality: Quality for JPG/WebP (1-100)
         overwrite: Whether to override existing files
         padding: Proportion of image to leave as padding (0-0.5)
+        png_compress_level: zlib level for PNG output (0-9)
+        encoder: JPEG/WebP encoder; "vips" requires pyvips
+        ctx: Batch state to reuse fonts from (internal; overrides font_path)
 
     Returns:
         Path to the saved image
 
     Raises:
-        ValueError: For invalid colors or font issues
+        ValueError: For invalid colors, font issues, or encoder="vips" without pyvips
         OSError: For file writing problems
     """
     if os.path.exists(output_path) and not overwrite:
         print(f"Skipping {output_path} (already exists)")
         return output_path
 
-    if not font_path:
-        font_path = find_system_font()
+    _check_encoder(encoder)
+    if ctx is None:
+        ctx = _BatchContext(font_path or find_system_font())
+
+    img = _render_placeholder(
+        ctx, number, size, bg_color, text_color, _image_mode([format], bg_color, text_color),
+        font_size, padding
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    return _save_image(img, output_path, format, jpg_quality, png_compress_level, encoder)
+
+
+def _image_mode(formats: List[str], bg_color: str, text_color: str) -> str:
+    """
+    Return the render mode suitable for all of the given output formats.
+
+    RGBA is only used when a format can store alpha and one of the colors is
+    actually translucent; opaque placeholders render and encode faster as RGB.
+
+    Raises:
+        ValueError: For invalid colors
+    """
+    if all(fmt == "jpg" for fmt in formats):
+        return 'RGB'
+    if parse_color(bg_color)[3] == 255 and parse_color(text_color)[3] == 255:
+        return 'RGB'
+    return 'RGBA'
+
+
+def _render_placeholder(
+        ctx: _BatchContext,
+        number: int,
+        size: Tuple[int, int],
+        bg_color: str,
+        text_color: str,
+        mode: str,
+        font_size: Optional[int],
+        padding: float
+) -> Image.Image:
+    """
+    Render a placeholder image in memory, ready for _save_image.
 
+    Raises:
+        ValueError: For invalid colors or font issues
+    """
     bg_rgba = parse_color(bg_color)
     text_rgba = parse_color(text_color)
 
-    if format == "jpg":
-        bg_rgb = bg_rgba[:3]
-        text_rgb = text_rgba[:3]
-        img = Image.new('RGB', size, bg_rgb)
+    if mode == 'RGB':
+        img = _new_background(ctx, 'RGB', size, bg_rgba[:3])
     else:
-        img = Image.new('RGBA', size, bg_rgba)
-    draw = ImageDraw.Draw(img)
+        img = _new_background(ctx, 'RGBA', size, bg_rgba)
 
     text = str(number)
+    fill_color = text_rgba[:3] if mode == 'RGB' else text_rgba
     try:
         if font_size is None:
-            target_ratio = 1.0 - 2 * padding
-            font_size = calculate_font_size(text, size, font_path, target_ratio)
-        font = ImageFont.truetype(font_path, font_size)
+            font_size = _auto_font_size(ctx, text, size, padding)
+        _draw_centered_text(ctx, img, text, font_size, fill_color)
     except Exception as e:
         raise ValueError(f"Font error: {e}")
 
-    text_bbox = font.getbbox(text)
-    text_width = text_bbox[2] - text_bbox[0]
-    x = (size[0] - text_width) // 2
-    y = (size[1] - text_bbox[1] - text_bbox[3]) // 2
+    return img
 
-    fill_color = text_rgba[:3] if format == "jpg" else text_rgba
-    draw.text((x, y), text, font=font, fill=fill_color)
 
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+def _save_image(
+        img: Image.Image,
+        output_path: str,
+        format: Literal["png", "jpg", "webp"],
+        jpg_quality: int,
+        png_compress_level: int,
+        encoder: Literal["pillow", "vips"]
+) -> str:
+    """
+    Encode img to output_path in the given format.
 
-    save_args = {}
-    if format == "jpg":
-        img.save(output_path, "JPEG", quality=jpg_quality, optimize=True)
-    elif format == "webp":
-        img.save(output_path, "WEBP", quality=jpg_quality, method=6)
+    PNGs are written with a single deflate pass at png_compress_level rather
+    than Pillow's multi-strategy optimize search, which buys next to nothing on
+    flat-color placeholders. The image is encoded in memory and written with a
+    single write call, so no partial file is left behind if encoding fails.
+    With encoder="vips", JPEG and WebP are encoded with libvips (see
+    _check_encoder). Safe to call from a worker thread: both encoders release
+    the GIL while encoding.
+
+    Raises:
+        OSError: For file writing problems
+    """
+    if encoder == "vips" and format in ("jpg", "webp"):
+        data = _encode_with_vips(img, format, jpg_quality)
     else:
-        img.save(output_path, "PNG", optimize=True)
+        buffer = io.BytesIO()
+        if format == "jpg":
+            img.save(buffer, "JPEG", quality=jpg_quality, optimize=True)
+        elif format == "webp":
+            img.save(buffer, "WEBP", quality=jpg_quality, method=6)
+        else:
+            img.save(buffer, "PNG", compress_level=png_compress_level)
+        data = buffer.getbuffer()
+
+    with open(output_path, "wb") as f:
+        f.write(data)
 
     return output_path
 
 
+@lru_cache(maxsize=None)
+def _import_pyvips():
+    """
+    Import the optional pyvips module on first use.
+
+    Kept out of module import so runs (and pool workers) using the default
+    Pillow encoder never pay for loading libvips.
+
+    Returns:
+        The pyvips module, or None if pyvips or libvips is not installed
+    """
+    try:
+        import pyvips
+    except (ImportError, OSError):
+        return None
+    return pyvips
+
+
+def _check_encoder(encoder: Literal["pillow", "vips"]) -> None:
+    """
+    Make sure the requested encoder is usable before any work is done.
+
+    Raises:
+        ValueError: If encoder is "vips" but pyvips is not installed
+    """
+    if encoder == "vips" and _import_pyvips() is None:
+        raise ValueError("The vips encoder requires pyvips and libvips (pip install pyvips)")
+
+
+def _encode_with_vips(img: Image.Image, format: Literal["jpg", "webp"], jpg_quality: int) -> bytes:
+    """Encode img as JPEG or WebP with libvips."""
+    vips_img = _import_pyvips().Image.new_from_memory(
+        img.tobytes(), img.width, img.height, len(img.getbands()), "uchar"
+    )
+    if format == "jpg":
+        return vips_img.jpegsave_buffer(Q=jpg_quality, optimize_coding=True)
+    return vips_img.webpsave_buffer(Q=jpg_quality)
+
+
+def _save_outputs(
+        img: Image.Image,
+        outputs: List[Tuple[str, str]],
+        jpg_quality: int,
+        png_compress_level: int,
+        encoder: Literal["pillow", "vips"]
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Save one rendered image to every (path, format) output, reporting failures instead of raising.
+
+    The RGB copy JPEG needs is converted at most once per image.
+
+    Returns:
+        (path, error) tuples, where error is None on success
+    """
+    results = []
+    rgb_img = img if img.mode == 'RGB' else None
+    for output_path, fmt in outputs:
+        try:
+            if fmt == "jpg" and rgb_img is None:
+                rgb_img = img.convert('RGB')
+            _save_image(rgb_img if fmt == "jpg" else img, output_path, fmt, jpg_quality, png_compress_level, encoder)
+            results.append((output_path, None))
+        except Exception as e:
+            results.append((output_path, str(e)))
+    return results
+
+
+def _render_task(
+        ctx: _BatchContext,
+        task: Tuple[int, List[Tuple[str, str]]],
+        **render_args
+) -> Tuple[List[Tuple[str, Optional[str]]], Optional[Image.Image], List[Tuple[str, str]]]:
+    """
+    Render one number of a batch once for all of its outputs.
+
+    Args:
+        ctx: Batch state of the current process
+        task: (number, [(output_path, format), ...]) pair
+        **render_args: Remaining arguments for _render_placeholder
+
+    Returns:
+        (results, img, outputs) tuple: (path, error) results of a failed render,
+        the rendered image (None if rendering failed) and the outputs it has to
+        be saved to
+    """
+    number, outputs = task
+    try:
+        img = _render_placeholder(ctx, number, **render_args)
+    except Exception as e:
+        return [(output_path, str(e)) for output_path, _ in outputs], None, []
+    return [], img, outputs
+
+
+_worker_ctx: Optional[_BatchContext] = None
+
+
+def _init_worker(font_path: str) -> None:
+    """Create the batch context of the current (worker) process."""
+    global _worker_ctx
+    _worker_ctx = _BatchContext(font_path)
+
+
+def _worker(
+        task: Tuple[int, List[Tuple[str, str]]],
+        jpg_quality: int,
+        png_compress_level: int,
+        encoder: Literal["pillow", "vips"],
+        **render_args
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Generate all outputs of one number of a batch, reporting failures instead of raising.
+
+    Defined at module level so it can be pickled for the process pool.
+
+    Returns:
+        (path, error) tuples, where error is None on success
+    """
+    results, img, outputs = _render_task(_worker_ctx, task, **render_args)
+    if img is not None:
+        results += _save_outputs(img, outputs, jpg_quality, png_compress_level, encoder)
+        _worker_ctx.spare_canvases.append(img)
+    # Pool workers exit without running atexit handlers
+    _flush_metrics()
+    return results
+
+
+def _finish_task(
+        ctx: _BatchContext,
+        results: List[Tuple[str, Optional[str]]],
+        img: Optional[Image.Image],
+        saving: Optional[Future]
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Wait for a task's pending save and return all of its (path, error) results.
+
+    Once saved, the task's canvas is handed back to ctx for reuse.
+    """
+    if saving is None:
+        return results
+    results = results + saving.result()
+    ctx.spare_canvases.append(img)
+    return results
+
+
+def _generate_serial(
+        tasks: List[Tuple[int, List[Tuple[str, str]]]],
+        font_path: str,
+        jpg_quality: int,
+        png_compress_level: int,
+        encoder: Literal["pillow", "vips"],
+        **render_args
+) -> Iterator[List[Tuple[str, Optional[str]]]]:
+    """
+    Generate tasks in this process, overlapping rendering with encoding.
+
+    Images are rendered on the calling thread while a small thread pool encodes
+    the previous ones. The number of images in flight is bounded so memory use
+    does not grow with the batch size.
+
+    Yields:
+        Lists of (path, error) tuples in task order, where error is None on success
+    """
+    ctx = _BatchContext(font_path)
+    encode_workers = min(4, os.cpu_count() or 1)
+    in_flight = deque()
+
+    with ThreadPoolExecutor(max_workers=encode_workers) as encode_pool:
+        for task in tasks:
+            results, img, outputs = _render_task(ctx, task, **render_args)
+            saving = None
+            if img is not None:
+                saving = encode_pool.submit(_save_outputs, img, outputs, jpg_quality, png_compress_level, encoder)
+            in_flight.append((results, img, saving))
+            if len(in_flight) > 2 * encode_workers:
+                yield _finish_task(ctx, *in_flight.popleft())
+        while in_flight:
+            yield _finish_task(ctx, *in_flight.popleft())
+
+
+def _report_results(
+        results: Iterable[List[Tuple[str, Optional[str]]]],
+        count: int,
+        quiet: bool,
+        progress: bool,
+        label: str = "Generated"
+) -> List[str]:
+    """
+    Print the outcome of each batch task and collect the paths that were saved.
+
+    Errors are always printed. Otherwise a "<label>: <path>" line is printed per
+    file, or a single progress line every _PROGRESS_INTERVAL tasks with progress,
+    or nothing when quiet.
+
+    Returns:
+        List of paths to saved images
+    """
+    generated_files = []
+    for done, task_results in enumerate(results, 1):
+        for path, error in task_results:
+            if error is None:
+                generated_files.append(path)
+                if not quiet and not progress:
+                    print(f"{label}: {path}")
+            else:
+                print(f"Error generating {path}: {error}")
+        if progress and not quiet and (done % _PROGRESS_INTERVAL == 0 or done == count):
+            print(f"Progress: {done}/{count} images")
+    return generated_files
+
+
+def _write_stubs(task: Tuple[int, List[Tuple[str, str]]]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Create an empty file for every output of a task, reporting failures instead of raising.
+
+    Returns:
+        (path, error) tuples, where error is None on success
+    """
+    results = []
+    for output_path, _ in task[1]:
+        try:
+            open(output_path, "wb").close()
+            results.append((output_path, None))
+        except OSError as e:
+            results.append((output_path, str(e)))
+    return results
+
+
+def _in_batch_order(output_paths: List[str], skipped_files: List[str], generated_files: List[str]) -> List[str]:
+    """Return the skipped and generated paths in the batch's number-then-format order."""
+    done = set(skipped_files).union(generated_files)
+    return [path for path in output_paths if path in done]
+
+
 def generate_placeholder_images(
         output_dir: str,
         count: int = 10,
@@ -239,7 +844,14 @@ def generate_placeholder_images(
         font_path: Optional[str] = None,
         jpg_quality: int = 90,
         overwrite: bool = False,
-        padding: float = 0.2
+        padding: float = 0.2,
+        png_compress_level: int = 1,
+        encoder: Literal["pillow", "vips"] = "pillow",
+        workers: Optional[int] = None,
+        formats: Optional[List[Literal["png", "jpg", "webp"]]] = None,
+        quiet: bool = False,
+        progress: bool = False,
+        stub: bool = False
 ) -> List[str]:
     """
     Generate multiple placeholder images with sequential numbers.
@@ -258,32 +870,101 @@ def generate_placeholder_images(
         jpg_quality: Quality for JPG/WebP (1-100)
         overwrite: Whether to override existing files
         padding: Proportion of image to leave as padding (0-0.5)
+        png_compress_level: zlib level for PNG output (0-9)
+        encoder: JPEG/WebP encoder; "vips" requires pyvips
+        workers: Number of worker processes (defaults to CPU count). With 1, images
+            are rendered in this process while a thread pool encodes them
+        formats: Output formats to save every image in (overrides format). Each
+            number is rendered once however many formats are requested
+        quiet: Only print errors
+        progress: Print a progress line every 100 images instead of a line per file
+        stub: Create empty files instead of images. The files are NOT valid
+            images; this is only for tests that need the paths to exist
 
     Returns:
-        List of paths to saved images
+        List of paths to saved images in number order (then format order),
+        including existing ones that were skipped
 
     Raises:
+        ValueError: For invalid colors, or encoder="vips" without pyvips
         OSError: If output directory can't be created
     """
-    os.makedirs(output_dir, exist_ok=True)
-    generated_files = []
+    # The prefix may name a subdirectory; every image of the batch lands in the same one
+    image_dir = os.path.dirname(os.path.join(output_dir, prefix)) or "."
+    os.makedirs(image_dir, exist_ok=True)
+
+    formats = list(dict.fromkeys(formats or [format]))
+    existing_files = frozenset() if overwrite else frozenset(os.listdir(image_dir))
 
+    # Existing files are filtered out here so that workers only receive real work
+    tasks = []
+    output_paths = []
+    skipped_files = []
     for i in range(count):
         current_num = start_num + i
-        filename = f"{prefix}{current_num}.{format}"
-        output_path = os.path.join(output_dir, filename)
+        outputs = []
+        for fmt in formats:
+            filename = f"{prefix}{current_num}.{fmt}"
+            output_path = os.path.join(output_dir, filename)
+            output_paths.append(output_path)
+            if os.path.basename(filename) in existing_files:
+                skipped_files.append(output_path)
+            else:
+                outputs.append((output_path, fmt))
+        if outputs:
+            tasks.append((current_num, outputs))
 
-        try:
-            path = generate_placeholder_image(
-                current_num, output_path, size, bg_color, text_color, format,
-                font_path, font_size, jpg_quality, overwrite, padding
+    if skipped_files and not quiet:
+        print(f"Skipping {len(skipped_files)} existing files")
+
+    if stub:
+        generated_files = _report_results(
+            map(_write_stubs, tasks), len(tasks), quiet, progress, label="Created stub"
+        )
+        return _in_batch_order(output_paths, skipped_files, generated_files)
+
+    if not font_path:
+        font_path = find_system_font()
+    mode = _image_mode(formats, bg_color, text_color)
+    _check_encoder(encoder)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Every pool worker is started up front, so never start more than there are tasks
+    workers = min(workers, len(tasks))
+
+    task_args = dict(
+        jpg_quality=jpg_quality, png_compress_level=png_compress_level, encoder=encoder, size=size,
+        bg_color=bg_color, text_color=text_color, mode=mode, font_size=font_size, padding=padding
+    )
+
+    if workers > 1:
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(font_path,)
+        ) as executor:
+            results = executor.map(
+                partial(_worker, **task_args), tasks, chunksize=max(1, len(tasks) // (workers * 4))
             )
-            generated_files.append(path)
-            print(f"Generated: {path}")
-        except Exception as e:
-            print(f"Error generating {output_path}: {e}")
+            generated_files = _report_results(results, len(tasks), quiet, progress)
+    else:
+        results = _generate_serial(tasks, font_path, **task_args)
+        generated_files = _report_results(results, len(tasks), quiet, progress)
+    _flush_metrics()
 
-    return generated_files
+    return _in_batch_order(output_paths, skipped_files, generated_files)
+
+
+def _parse_formats(value: str) -> List[str]:
+    """
+    Parse a comma-separated list of image formats, e.g. "png,jpg".
+
+    Raises:
+        argparse.ArgumentTypeError: For unsupported formats
+    """
+    formats = [fmt.strip().lower() for fmt in value.split(",") if fmt.strip()]
+    invalid = [fmt for fmt in formats if fmt not in ("png", "jpg", "webp")]
+    if not formats or invalid:
+        raise argparse.ArgumentTypeError(f"invalid format: {value!r} (choose from png, jpg, webp)")
+    return formats
 
 
 def main():
@@ -300,13 +981,25 @@ def main():
     parser.add_argument("--height", type=int, default=600, help="Image height in pixels")
     parser.add_argument("--bg-color", default="#cccccc", help="Background color (hex/name)")
     parser.add_argument("--text-color", default="#333333", help="Text color (hex/name)")
-    parser.add_argument("--format", choices=["png", "jpg", "webp"], default="png", help="Image format")
+    parser.add_argument("--format", type=_parse_formats, default="png", metavar="{png,jpg,webp}[,...]",
+                        help="Image format, or a comma-separated list to save each image in several formats")
     parser.add_argument("--prefix", default="img_", help="Filename prefix")
     parser.add_argument("--font-path", help="Path to custom font (.ttf/.otf)")
     parser.add_argument("--font-size", type=int, help="Font size (auto-calculated if omitted)")
     parser.add_argument("--jpg-quality", type=int, default=90, help="JPEG/WebP quality (1-100)")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing files")
     parser.add_argument("--padding", type=float, default=0.2, help="Padding around text (0.0-0.5)")
+    parser.add_argument("--png-compress-level", type=int, default=1, choices=range(10), metavar="{0-9}",
+                        help="PNG zlib compression level")
+    parser.add_argument("--encoder", choices=["pillow", "vips"], default="pillow",
+                        help="JPEG/WebP encoder (vips requires pyvips)")
+    parser.add_argument("--workers", type=int, help="Worker processes (defaults to CPU count)")
+    parser.add_argument("--stub", action="store_true",
+                        help="Create empty placeholder files (NOT valid images) for tests that only need the paths")
+    output_mode = parser.add_mutually_exclusive_group()
+    output_mode.add_argument("--quiet", action="store_true", help="Only report errors")
+    output_mode.add_argument("--progress", action="store_true",
+                             help="Report progress every 100 images instead of every file")
 
     args = parser.parse_args()
 
@@ -318,15 +1011,25 @@ def main():
             size=(args.width, args.height),
             bg_color=args.bg_color,
             text_color=args.text_color,
-            format=args.format,
+            formats=args.format,
             prefix=args.prefix,
             font_path=args.font_path,
             font_size=args.font_size,
             jpg_quality=args.jpg_quality,
             overwrite=args.overwrite,
-            padding=args.padding
+            padding=args.padding,
+            png_compress_level=args.png_compress_level,
+            encoder=args.encoder,
+            workers=args.workers,
+            quiet=args.quiet,
+            progress=args.progress,
+            stub=args.stub
         )
-        print(f"\nSuccessfully generated {args.count} images in {args.output_dir}")
+        if not args.quiet:
+            if args.stub:
+                print(f"\nSuccessfully created {args.count} stub files in {args.output_dir}")
+            else:
+                print(f"\nSuccessfully generated {args.count} images in {args.output_dir}")
 
     except Exception as e:
         print(f"Error: {str(e)}")
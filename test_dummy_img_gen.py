@@ -0,0 +1,146 @@
+"""Tests for dummy_img_gen."""
+
+import json
+import os
+
+import pytest
+from PIL import Image
+
+import dummy_img_gen
+
+
+@pytest.fixture(autouse=True)
+def isolated_metrics_cache(tmp_path, monkeypatch):
+    """Keep the on-disk font size cache out of the user's home directory."""
+    monkeypatch.setattr(dummy_img_gen, "_METRICS_CACHE_PATH", str(tmp_path / "cache" / "fontmetrics.json"))
+    dummy_img_gen._metrics_cache.cache_clear()
+    dummy_img_gen._pending_metrics.clear()
+    yield
+    dummy_img_gen._metrics_cache.cache_clear()
+    dummy_img_gen._pending_metrics.clear()
+
+
+def test_find_system_font_is_memoized():
+    dummy_img_gen.find_system_font.cache_clear()
+    first = dummy_img_gen.find_system_font()
+    second = dummy_img_gen.find_system_font()
+
+    assert first == second
+    assert dummy_img_gen.find_system_font.cache_info().hits > 0
+
+
+def test_serial_batch(tmp_path):
+    out_dir = tmp_path / "out"
+    paths = dummy_img_gen.generate_placeholder_images(
+        str(out_dir), count=3, start_num=9, size=(120, 80), workers=1, quiet=True
+    )
+
+    assert paths == [str(out_dir / f"img_{n}.png") for n in (9, 10, 11)]
+    for path in paths:
+        with Image.open(path) as img:
+            assert img.format == "PNG"
+            assert img.size == (120, 80)
+            # The number is drawn in the middle, the corner stays background
+            assert img.getpixel((0, 0)) == (204, 204, 204)
+            assert len(img.getcolors()) > 1
+    assert sorted(os.listdir(out_dir)) == ["img_10.png", "img_11.png", "img_9.png"]
+
+
+def test_cli_format_before_output_dir(tmp_path, monkeypatch):
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr(
+        "sys.argv", ["dummy_img_gen.py", "--format", "jpg", str(out_dir), "--count", "1", "--quiet"]
+    )
+    dummy_img_gen.main()
+
+    assert os.listdir(out_dir) == ["img_1.jpg"]
+
+
+def test_cli_format_list(tmp_path, monkeypatch):
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr(
+        "sys.argv", ["dummy_img_gen.py", str(out_dir), "--format", "png,webp", "--count", "1", "--quiet"]
+    )
+    dummy_img_gen.main()
+
+    assert sorted(os.listdir(out_dir)) == ["img_1.png", "img_1.webp"]
+
+
+def test_resumed_batch_returns_paths_in_number_order(tmp_path):
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "img_2.png").write_bytes(b"")
+
+    paths = dummy_img_gen.generate_placeholder_images(
+        str(out_dir), count=3, size=(60, 40), workers=1, quiet=True
+    )
+
+    assert paths == [str(out_dir / f"img_{n}.png") for n in (1, 2, 3)]
+    # Existing files are skipped, not regenerated
+    assert (out_dir / "img_2.png").stat().st_size == 0
+
+
+def test_vips_encoder_without_pyvips_fails_up_front(tmp_path, monkeypatch):
+    monkeypatch.setattr(dummy_img_gen, "_import_pyvips", lambda: None)
+
+    with pytest.raises(ValueError, match="pyvips"):
+        dummy_img_gen.generate_placeholder_images(
+            str(tmp_path / "out"), count=2, format="jpg", encoder="vips", workers=1, quiet=True
+        )
+    assert os.listdir(tmp_path / "out") == []
+
+
+def test_corrupt_metrics_entry_is_measured_again():
+    try:
+        font_path = dummy_img_gen.find_system_font()
+    except FileNotFoundError:
+        pytest.skip("no TrueType font available")
+    expected = dummy_img_gen.calculate_font_size("7", (120, 80), font_path)
+    dummy_img_gen._flush_metrics()
+
+    with open(dummy_img_gen._METRICS_CACHE_PATH, encoding="utf-8") as f:
+        cache = json.load(f)
+    (key,) = cache
+    assert cache[key] == expected
+    key_fields = json.loads(key)
+    assert key_fields[:2] == [dummy_img_gen._METRICS_CACHE_VERSION, dummy_img_gen.PIL.__version__]
+
+    with open(dummy_img_gen._METRICS_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({key: "476"}, f)
+    dummy_img_gen._metrics_cache.cache_clear()
+
+    assert dummy_img_gen.calculate_font_size("7", (120, 80), font_path) == expected
+    dummy_img_gen._flush_metrics()
+    with open(dummy_img_gen._METRICS_CACHE_PATH, encoding="utf-8") as f:
+        assert json.load(f) == {key: expected}
+
+
+def test_cli_stub_creates_empty_files(tmp_path, monkeypatch, capsys):
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr("sys.argv", ["dummy_img_gen.py", str(out_dir), "--count", "2", "--stub"])
+    dummy_img_gen.main()
+
+    assert sorted(os.listdir(out_dir)) == ["img_1.png", "img_2.png"]
+    assert all((out_dir / name).stat().st_size == 0 for name in os.listdir(out_dir))
+    out = capsys.readouterr().out
+    assert f"Created stub: {out_dir / 'img_1.png'}" in out
+    assert "Generated:" not in out
+    assert "created 2 stub files" in out
+
+
+def test_process_pool_batch(tmp_path, monkeypatch):
+    def serial_not_expected(*args, **kwargs):
+        raise AssertionError("batch ran serially")
+
+    monkeypatch.setattr(dummy_img_gen, "_generate_serial", serial_not_expected)
+    out_dir = tmp_path / "out"
+    paths = dummy_img_gen.generate_placeholder_images(
+        str(out_dir), count=4, size=(90, 60), formats=["png", "jpg"], workers=2, quiet=True
+    )
+
+    assert paths == [str(out_dir / f"img_{n}.{fmt}") for n in (1, 2, 3, 4) for fmt in ("png", "jpg")]
+    for path in paths:
+        with Image.open(path) as img:
+            img.load()
+            assert img.format == ("PNG" if path.endswith(".png") else "JPEG")
+            assert img.size == (90, 60)